@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 from enum import IntEnum
-from typing import Optional
+from typing import Dict, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -25,8 +25,11 @@ class Command(IntEnum):
         Returns:
             Corresponding Command, or None for unknown snap counts.
         """
-        try:
-            return cls(count)
-        except ValueError:
+        cmd = _SNAP_TO_COMMAND.get(count)
+        if cmd is None:
             logger.warning("Unknown snap count %d, no command mapped", count)
-            return None
+        return cmd
+
+
+# Precomputed lookup so polling avoids IntEnum construction and exception handling
+_SNAP_TO_COMMAND: Dict[int, Command] = {int(c): c for c in Command}
@@ -2,28 +2,47 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
-from dataclasses import dataclass, field
+import pickle
+from collections import OrderedDict
+from dataclasses import MISSING, dataclass, field
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import (
+    Dict, Mapping, Optional, Tuple, Union, get_args, get_origin, get_type_hints,
+)
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+    _HAS_LIBYAML = True
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+    _HAS_LIBYAML = False
+
 logger = logging.getLogger(__name__)
 
 # Project root: two levels up from this file (followme/config.py -> follow-me-drone/)
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 
+# Maximum number of parsed configs kept in the in-process cache
+_CONFIG_CACHE_SIZE = 16
+
+# Per-user directory for pickled configs that survive across process starts
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "followme"
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PIDConfig:
     kp: float = 0.2
     ki: float = 0.04
     kd: float = 0.005
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DroneConfig:
     frame_width: int = 960
     frame_height: int = 720
@@ -32,7 +51,7 @@ class DroneConfig:
     takeoff_ascent_duration: float = 3.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TrackingConfig:
     pid: PIDConfig = field(default_factory=PIDConfig)
     face_area_min: int = 14000
@@ -47,17 +66,23 @@ class TrackingConfig:
     lost_face_threshold: int = 15
     search_rotation_speed: int = 40
     loop_interval: float = 0.1
+    display_every: int = 1
+    cv_threads: int = 0
+    cpu_affinity: Optional[Tuple[int, ...]] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FaceDetectionConfig:
     cascade_path: str = "models/haarcascade_frontalface_default.xml"
     scale_factor: float = 1.2
     min_neighbors: int = 8
     center_history_size: int = 20
+    detection_scale: float = 0.5
+    detect_stride: int = 5
+    roi_margin: float = 0.5
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CircleMotionConfig:
     speed: int = -15
     yaw_speed: int = 35
@@ -65,21 +90,23 @@ class CircleMotionConfig:
     video_fps: int = 30
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GestureConfig:
     serial_port: str = "/dev/ttyUSB0"
     baud_rate: int = 38400
     snap_threshold: int = 50000
     snap_time_window: float = 0.7
     max_sensor_buffer: int = 1000
+    read_timeout: float = 0.1
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IPCConfig:
-    cache_file: str = "cache.pkl"
+    cache_file: str = "cache.bin"
+    history_size: int = 64
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     drone: DroneConfig = field(default_factory=DroneConfig)
     tracking: TrackingConfig = field(default_factory=TrackingConfig)
@@ -89,45 +116,158 @@ class AppConfig:
     ipc: IPCConfig = field(default_factory=IPCConfig)
 
 
-def _build_nested(cls, data: dict):
-    """Recursively build a frozen dataclass from a dict, handling nested dataclasses."""
-    if data is None:
-        return cls()
-    fields = {f.name: f for f in cls.__dataclass_fields__.values()}
-    kwargs = {}
-    for key, value in data.items():
-        if key in fields and hasattr(fields[key].type, "__dataclass_fields__"):
-            # Resolve the actual class for nested dataclasses
-            nested_cls = _resolve_type(fields[key].type)
-            if nested_cls:
-                kwargs[key] = _build_nested(nested_cls, value)
-                continue
-        if key in fields:
-            kwargs[key] = value
-    return cls(**kwargs)
+_CONFIG_CLASSES = (
+    AppConfig, DroneConfig, TrackingConfig, PIDConfig, FaceDetectionConfig,
+    CircleMotionConfig, GestureConfig, IPCConfig,
+)
+
+# Parsed configs keyed by (path, mtime_ns, size); AppConfig is frozen so sharing is safe
+_CONFIG_CACHE: "OrderedDict[tuple, AppConfig]" = OrderedDict()
+
+# Bump when the disk cache layout or build logic changes; field names and
+# defaults are checked too, since a cached config bakes in defaults for missing keys
+_DISK_CACHE_FORMAT = 5
+_DISK_CACHE_SCHEMA = (_DISK_CACHE_FORMAT,) + tuple(
+    (cls.__name__, tuple(
+        (f.name, None if f.default is MISSING else repr(f.default))
+        for f in cls.__dataclass_fields__.values()
+    ))
+    for cls in _CONFIG_CLASSES
+)
 
 
 def _resolve_type(type_hint) -> Optional[type]:
-    """Resolve a type hint string or type to an actual class."""
-    type_map = {
-        "PIDConfig": PIDConfig,
-        "DroneConfig": DroneConfig,
-        "TrackingConfig": TrackingConfig,
-        "FaceDetectionConfig": FaceDetectionConfig,
-        "CircleMotionConfig": CircleMotionConfig,
-        "GestureConfig": GestureConfig,
-        "IPCConfig": IPCConfig,
-    }
-    if isinstance(type_hint, str):
-        return type_map.get(type_hint)
+    """Return the class if a resolved type hint is a dataclass, else None."""
     if isinstance(type_hint, type) and hasattr(type_hint, "__dataclass_fields__"):
         return type_hint
     return None
 
 
+def _is_tuple_hint(type_hint) -> bool:
+    """Return True for ``Tuple[...]`` and ``Optional[Tuple[...]]`` hints."""
+    if get_origin(type_hint) is Union:
+        return any(_is_tuple_hint(arg) for arg in get_args(type_hint))
+    return get_origin(type_hint) is tuple
+
+
+def _as_tuple(value):
+    """Freeze a YAML sequence into a tuple, passing None through."""
+    return None if value is None else tuple(value)
+
+
+# Per-class map of field name -> nested dataclass (or None), resolved once at import
+_NESTED_FIELDS: Dict[type, Mapping[str, Optional[type]]] = {
+    cls: MappingProxyType({
+        name: _resolve_type(hint) for name, hint in get_type_hints(cls).items()
+    })
+    for cls in _CONFIG_CLASSES
+}
+
+# Per-class names of tuple fields, converted from YAML lists so configs stay immutable
+_TUPLE_FIELDS: Dict[type, frozenset] = {
+    cls: frozenset(
+        name for name, hint in get_type_hints(cls).items() if _is_tuple_hint(hint)
+    )
+    for cls in _CONFIG_CLASSES
+}
+
+
+def _disk_cache_key(resolved: Path) -> str:
+    """Stable per-path prefix for disk cache entries."""
+    return hashlib.md5(str(resolved).encode(), usedforsecurity=False).hexdigest()
+
+
+def _read_disk_cache(cache_path: Path) -> Optional[AppConfig]:
+    """Return the pickled config at ``cache_path`` if present and schema-compatible."""
+    try:
+        with open(cache_path, "rb") as f:
+            schema, config = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, TypeError, ValueError) as e:
+        logger.debug("Ignoring unreadable config cache %s: %s", cache_path, e)
+        return None
+    if schema != _DISK_CACHE_SCHEMA:
+        return None
+    return config
+
+
+def _write_disk_cache(cache_path: Path, key: str, config: AppConfig) -> None:
+    """Atomically write a pickled config and delete stale entries for the same path."""
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            pickle.dump((_DISK_CACHE_SCHEMA, config), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.debug("Could not write config cache %s: %s", cache_path, e)
+        return
+
+    for stale in cache_path.parent.glob(f"{key}-*.pkl"):
+        if stale != cache_path:
+            try:
+                stale.unlink()
+            except OSError:
+                pass
+
+
+def _generate_constructors() -> dict:
+    """Compile one ``_from_dict_<Class>`` function per config dataclass.
+
+    Each generated function builds its dataclass from a plain dict with direct
+    keyword arguments and nested constructor calls, so loading a config does no
+    per-call reflection over ``__dataclass_fields__``. Unknown keys are ignored,
+    a ``None`` section yields the dataclass defaults and YAML lists for tuple
+    fields are converted to tuples.
+    """
+    namespace: dict = {"_as_tuple": _as_tuple}
+    for cls in _CONFIG_CLASSES:
+        name = cls.__name__
+        namespace[name] = cls
+        nested_fields = _NESTED_FIELDS[cls]
+        tuple_fields = _TUPLE_FIELDS[cls]
+        args = []
+        for f in cls.__dataclass_fields__.values():
+            nested_cls = nested_fields[f.name]
+            if nested_cls is not None:
+                args.append(f"{f.name}=_from_dict_{nested_cls.__name__}(d.get({f.name!r}))")
+            elif f.default is not MISSING:
+                default_name = f"_default_{name}_{f.name}"
+                namespace[default_name] = f.default
+                value = f"d.get({f.name!r}, {default_name})"
+                if f.name in tuple_fields:
+                    value = f"_as_tuple({value})"
+                args.append(f"{f.name}={value}")
+            elif f.default_factory is not MISSING:
+                factory_name = f"_factory_{name}_{f.name}"
+                namespace[factory_name] = f.default_factory
+                args.append(
+                    f"{f.name}=d[{f.name!r}] if {f.name!r} in d else {factory_name}()"
+                )
+            else:
+                args.append(f"{f.name}=d[{f.name!r}]")
+        source = (
+            f"def _from_dict_{name}(d):\n"
+            f"    if d is None:\n"
+            f"        return {name}()\n"
+            f"    return {name}({', '.join(args)})\n"
+        )
+        exec(source, namespace)
+    return namespace
+
+
+_CONSTRUCTORS = _generate_constructors()
+_from_dict_AppConfig = _CONSTRUCTORS["_from_dict_AppConfig"]
+
+
 def load_config(path: Optional[str] = None) -> AppConfig:
     """Load configuration from a YAML file, falling back to defaults.
 
+    Parsed configs are pickled under ``CACHE_DIR`` keyed by the file's path and
+    mtime, and reused on later startups until either, or the config schema,
+    changes.
+
     Args:
         path: Path to YAML config file. If None, looks for config/default.yaml
               relative to the project root.
@@ -146,7 +286,25 @@ def load_config(path: Optional[str] = None) -> AppConfig:
         logger.warning("Config file not found at %s, using defaults", resolved)
         return AppConfig()
 
-    with open(resolved) as f:
-        raw = yaml.safe_load(f) or {}
-
-    return _build_nested(AppConfig, raw)
+    st = resolved.stat()
+    key = (str(resolved), st.st_mtime_ns, st.st_size)
+    cached = _CONFIG_CACHE.get(key)
+    if cached is not None:
+        _CONFIG_CACHE.move_to_end(key)
+        return cached
+
+    disk_key = _disk_cache_key(resolved)
+    cache_path = CACHE_DIR / f"{disk_key}-{st.st_mtime_ns}.pkl"
+    config = _read_disk_cache(cache_path)
+    if config is None:
+        if not _HAS_LIBYAML:
+            logger.debug("PyYAML lacks libyaml, parsing %s with the pure-Python loader", resolved)
+        with open(resolved) as f:
+            raw = yaml.load(f, Loader=_SafeLoader) or {}
+        config = _from_dict_AppConfig(raw)
+        _write_disk_cache(cache_path, disk_key, config)
+
+    _CONFIG_CACHE[key] = config
+    if len(_CONFIG_CACHE) > _CONFIG_CACHE_SIZE:
+        _CONFIG_CACHE.popitem(last=False)
+    return config
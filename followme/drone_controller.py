@@ -3,13 +3,15 @@
 from __future__ import annotations
 
 import logging
+import queue
+import threading
 import time
 from collections import deque
 from typing import Optional, Tuple
 
 import cv2
 import numpy as np
-from djitellopy import Tello
+from djitellopy import BackgroundFrameRead, Tello
 
 from followme.config import AppConfig, CircleMotionConfig, DroneConfig, TrackingConfig
 from followme.face_detector import FaceInfo
@@ -17,6 +19,12 @@ from followme.pid import PIDController
 
 logger = logging.getLogger(__name__)
 
+# Vertical speed (cm/s) commanded while above the configured height limit
+_HEIGHT_LIMIT_DESCENT_SPEED = -10
+
+# Frames buffered for the video writer thread before new frames are dropped
+_VIDEO_QUEUE_SIZE = 64
+
 
 class DroneConnection:
     """Manages the DJI Tello drone lifecycle: connect, takeoff, stream, land.
@@ -27,7 +35,9 @@ class DroneConnection:
 
     def __init__(self, config: DroneConfig) -> None:
         self._config = config
+        self._height_limit = config.height_limit
         self._tello = Tello()
+        self._frame_read: Optional[BackgroundFrameRead] = None
         self._airborne = False
 
     @property
@@ -40,6 +50,9 @@ class DroneConnection:
         battery = self._tello.get_battery()
         logger.info("Connected to Tello. Battery: %d%%", battery)
         self._tello.streamon()
+        # Latest-frame mode: the reader thread decodes continuously and keeps only
+        # the newest frame, so the tracker never works on a queued, stale one.
+        self._frame_read = self._tello.get_frame_read(with_queue=False)
         logger.info("Video stream started (%dx%d)", self._config.frame_width, self._config.frame_height)
 
     def takeoff(self) -> None:
@@ -51,8 +64,10 @@ class DroneConnection:
         time.sleep(self._config.takeoff_ascent_duration)
 
     def get_frame(self) -> np.ndarray:
-        """Get the current video frame from the drone camera."""
-        return self._tello.get_frame_read().frame
+        """Get the most recently decoded video frame from the drone camera."""
+        if self._frame_read is None:
+            self._frame_read = self._tello.get_frame_read(with_queue=False)
+        return self._frame_read.frame
 
     def send_control(self, lr: int, fb: int, ud: int, yaw: int) -> None:
         """Send RC control commands to the drone.
@@ -69,6 +84,26 @@ class DroneConnection:
         """Get current height in cm."""
         return self._tello.get_height()
 
+    def tick(self, lr: int, fb: int, ud: int, yaw: int) -> None:
+        """Send one control-loop command, enforcing the configured height limit.
+
+        Height comes from the state telemetry that djitellopy's receiver
+        thread keeps up to date, so this adds no round trip to the drone.
+        Above ``height_limit`` the tracking command is replaced by a descent.
+
+        Args:
+            lr: Left/right speed (-100 to 100).
+            fb: Forward/backward speed (-100 to 100).
+            ud: Up/down speed (-100 to 100).
+            yaw: Yaw rotation speed (-100 to 100).
+        """
+        tello = self._tello
+        if tello.get_height() > self._height_limit:
+            logger.warning("Height limit reached, descending")
+            tello.send_rc_control(0, 0, _HEIGHT_LIMIT_DESCENT_SPEED, 0)
+        else:
+            tello.send_rc_control(lr, fb, ud, yaw)
+
     def land(self) -> None:
         """Land the drone if it is airborne."""
         if self._airborne:
@@ -84,6 +119,7 @@ class DroneConnection:
             logger.error("Error during landing: %s", e)
         try:
             self._tello.streamoff()
+            self._frame_read = None
         except Exception as e:
             logger.error("Error stopping stream: %s", e)
 
@@ -97,9 +133,16 @@ class FaceTracker:
     Args:
         config: Tracking configuration with PID gains and target parameters.
         drone_config: Drone config for frame dimensions.
+        center_history_size: Number of recent frames considered for lost-face
+            detection (``face_detection.center_history_size``).
     """
 
-    def __init__(self, config: TrackingConfig, drone_config: DroneConfig) -> None:
+    def __init__(
+        self,
+        config: TrackingConfig,
+        drone_config: DroneConfig,
+        center_history_size: int = 20,
+    ) -> None:
         self._config = config
         self._frame_w = drone_config.frame_width
         self._frame_h = drone_config.frame_height
@@ -118,28 +161,23 @@ class FaceTracker:
             output_limits=(-config.vertical_speed_limit, config.vertical_speed_limit),
         )
 
-        # Face loss tracking
-        self._center_history: deque = deque(maxlen=drone_config.frame_width)
-        self._center_history_size = 20  # Use fixed size for lost-face detection
+        # Face loss tracking over a sliding window of recent centers
+        self._center_history_size = center_history_size
+        self._center_history: deque = deque(maxlen=self._center_history_size)
+        self._lost_count = 0  # Number of (0, 0) entries currently in the window
         self._last_known_direction: str = "+"
 
-    def compute_control(
-        self, face: Optional[FaceInfo], drone: DroneConnection
-    ) -> Tuple[int, int, int, int]:
+    def compute_control(self, face: Optional[FaceInfo]) -> Tuple[int, int, int, int]:
         """Compute RC control values based on detected face position.
 
+        Height safety is enforced by the caller against ``drone.height_limit``.
+
         Args:
             face: Detected face info, or None if no face found.
-            drone: Drone connection for height checking.
 
         Returns:
             Tuple of (left_right, forward_back, up_down, yaw) speeds.
         """
-        # Height safety check
-        if drone.get_height() > self._config.face_area_max:
-            # Use height_limit from the config instead
-            pass
-
         if face is None:
             return self._handle_lost_face()
 
@@ -149,7 +187,7 @@ class FaceTracker:
         else:
             self._last_known_direction = "+"
 
-        self._center_history.append((face.center_x, face.center_y))
+        self._record_center(face.center_x, face.center_y)
 
         # Compute errors
         x_error = face.center_x - self._target_x
@@ -160,11 +198,8 @@ class FaceTracker:
 
         # PID control for vertical (inverted and scaled)
         vertical_raw = self._vertical_pid.update(y_error)
-        y_speed = int(np.clip(
-            -self._config.vertical_speed_scale * vertical_raw,
-            -self._config.vertical_speed_limit,
-            self._config.vertical_speed_limit,
-        ))
+        limit = self._config.vertical_speed_limit
+        y_speed = int(max(-limit, min(limit, -self._config.vertical_speed_scale * vertical_raw)))
 
         # Forward/backward based on face area
         fb = self._compute_forward_back(face.area)
@@ -188,13 +223,9 @@ class FaceTracker:
 
     def _handle_lost_face(self) -> Tuple[int, int, int, int]:
         """Rotate to search for the face when it's lost."""
-        self._center_history.append((0, 0))
-
-        # Count recent frames with no face detected
-        recent = list(self._center_history)[-self._center_history_size:]
-        lost_count = sum(1 for x, y in recent if x == 0 and y == 0)
+        self._record_center(0, 0)
 
-        if lost_count > self._config.lost_face_threshold:
+        if self._lost_count > self._config.lost_face_threshold:
             speed = self._config.search_rotation_speed
             yaw = speed if self._last_known_direction == "+" else -speed
             logger.debug("Searching for face, rotating %s", self._last_known_direction)
@@ -203,16 +234,30 @@ class FaceTracker:
         # Recently lost, hold position
         return (0, 0, 0, 0)
 
+    def _record_center(self, x: int, y: int) -> None:
+        """Append a face center, keeping the running lost-frame count in sync."""
+        history = self._center_history
+        if len(history) == history.maxlen and history[0] == (0, 0):
+            self._lost_count -= 1
+        if x == 0 and y == 0:
+            self._lost_count += 1
+        history.append((x, y))
+
     def reset(self) -> None:
         """Reset PID controllers and tracking history."""
         self._yaw_pid.reset()
         self._vertical_pid.reset()
         self._center_history.clear()
+        self._lost_count = 0
 
 
 class CircleRecorder:
     """Records panoramic video while moving the drone in a circular path.
 
+    Frames are encoded on a background thread so encoder backpressure cannot
+    delay the RC control commands; if the writer falls behind, frames are
+    dropped rather than stalling the control loop.
+
     Args:
         config: Circle motion parameters (speed, yaw, duration, fps).
     """
@@ -220,11 +265,13 @@ class CircleRecorder:
     def __init__(self, config: CircleMotionConfig) -> None:
         self._config = config
 
-    def execute(self, drone: DroneConnection) -> None:
+    def execute(self, drone: DroneConnection, stop: Optional[threading.Event] = None) -> None:
         """Execute circular motion while recording video.
 
         Args:
             drone: Active drone connection to control and capture from.
+            stop: Optional event that ends the motion early when set
+                (e.g. on a shutdown signal).
         """
         logger.info(
             "Starting circle motion: speed=%d, yaw=%d, duration=%ds",
@@ -239,12 +286,27 @@ class CircleRecorder:
         video = cv2.VideoWriter(filename, fourcc, self._config.video_fps, (w, h))
         logger.info("Recording to %s", filename)
 
+        frames: queue.Queue = queue.Queue(maxsize=_VIDEO_QUEUE_SIZE)
+        writer = threading.Thread(
+            target=self._write_frames, args=(video, frames),
+            name="circle-video-writer", daemon=True,
+        )
+        writer.start()
+        dropped = 0
+
         start = time.time()
         try:
             while time.time() - start < self._config.duration:
+                if stop is not None and stop.is_set():
+                    logger.info("Circle motion stopped by shutdown request")
+                    break
                 frame = drone.get_frame()
                 if frame is not None:
-                    video.write(frame)
+                    # The drone's frame reader replaces (never mutates) its frame array
+                    try:
+                        frames.put_nowait(frame)
+                    except queue.Full:
+                        dropped += 1
                     cv2.imshow("Output", frame)
 
                 drone.send_control(self._config.speed, 0, 0, self._config.yaw_speed)
@@ -257,9 +319,33 @@ class CircleRecorder:
             logger.error("Error during circle motion: %s", e)
         finally:
             drone.send_control(0, 0, 0, 0)
+            frames.put(None)
+            writer.join()
             video.release()
+            if dropped:
+                logger.warning("Video writer fell behind, dropped %d frames", dropped)
             logger.info("Circle motion complete, video saved as %s", filename)
 
+    @staticmethod
+    def _write_frames(video: cv2.VideoWriter, frames: queue.Queue) -> None:
+        """Encode queued frames until the None sentinel arrives.
+
+        A write error stops encoding but the queue is still drained, so the
+        control loop never blocks on a full queue or on the sentinel.
+        """
+        failed = False
+        while True:
+            frame = frames.get()
+            if frame is None:
+                break
+            if failed:
+                continue
+            try:
+                video.write(frame)
+            except Exception as e:
+                logger.error("Error writing circle motion video: %s", e)
+                failed = True
+
 
 def take_picture(frame: np.ndarray) -> str:
     """Save the current frame as a PNG image.
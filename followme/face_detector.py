@@ -15,7 +15,7 @@ from followme.config import FaceDetectionConfig, PROJECT_ROOT
 logger = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FaceInfo:
     """Detected face information."""
 
@@ -33,9 +33,16 @@ class FaceDetector:
 
     Args:
         config: Face detection configuration parameters.
+        frame_size: Expected (width, height) of BGR input frames. If given, the
+            resize and grayscale buffers are allocated up front instead of on
+            the first frame.
     """
 
-    def __init__(self, config: FaceDetectionConfig) -> None:
+    def __init__(
+        self,
+        config: FaceDetectionConfig,
+        frame_size: Optional[Tuple[int, int]] = None,
+    ) -> None:
         self._config = config
         cascade_path = self._resolve_cascade_path(config.cascade_path)
         self._cascade = cv2.CascadeClassifier(str(cascade_path))
@@ -45,6 +52,42 @@ class FaceDetector:
             )
         logger.info("Loaded face cascade from %s", cascade_path)
 
+        # Buffers reused across frames; reallocated only if the frame size changes
+        self._frame_key: Optional[Tuple[Tuple[int, ...], np.dtype]] = None
+        self._small: Optional[np.ndarray] = None
+        self._gray: Optional[np.ndarray] = None
+
+        # Last face box in detection (downscaled) coordinates, for ROI search
+        self._last_box: Optional[Tuple[int, int, int, int]] = None
+        self._frames_since_full = 0
+        if frame_size is not None:
+            width, height = frame_size
+            self._ensure_buffers((height, width, 3), np.dtype(np.uint8))
+
+    @property
+    def scaled_frame(self) -> Optional[np.ndarray]:
+        """Downscaled BGR copy of the last frame passed to ``detect``.
+
+        None when ``detection_scale`` is 1.0. The buffer is overwritten by the
+        next ``detect`` call, so it can be annotated and displayed in between.
+        """
+        return self._small
+
+    def _ensure_buffers(self, frame_shape: Tuple[int, ...], dtype: np.dtype) -> None:
+        """(Re)allocate the downscale and grayscale buffers for a frame shape."""
+        if self._frame_key == (frame_shape, dtype):
+            return
+        scale = self._config.detection_scale
+        h, w = frame_shape[:2]
+        if scale != 1.0:
+            small_shape = (max(1, round(h * scale)), max(1, round(w * scale))) + frame_shape[2:]
+            self._small = np.empty(small_shape, dtype=dtype)
+            self._gray = np.empty(small_shape[:2], dtype=np.uint8)
+        else:
+            self._small = None
+            self._gray = np.empty((h, w), dtype=np.uint8)
+        self._frame_key = (frame_shape, dtype)
+
     @staticmethod
     def _resolve_cascade_path(path_str: str) -> Path:
         """Resolve cascade file path, trying project-relative then absolute."""
@@ -70,26 +113,43 @@ class FaceDetector:
     def detect(self, frame: np.ndarray) -> Optional[FaceInfo]:
         """Detect the largest face in the frame.
 
+        The cascade runs on a copy downscaled by ``detection_scale``; the
+        returned coordinates and area are in full-frame pixels. While a face is
+        being tracked, only a region around its last position is searched, with
+        a full-frame search every ``detect_stride`` frames or when the region
+        search misses.
+
         Args:
             frame: BGR image from the camera.
 
         Returns:
             FaceInfo for the largest detected face, or None if no face found.
         """
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        faces = self._cascade.detectMultiScale(
-            gray,
-            scaleFactor=self._config.scale_factor,
-            minNeighbors=self._config.min_neighbors,
-        )
-
-        if len(faces) == 0:
+        self._ensure_buffers(frame.shape, frame.dtype)
+        scale = self._config.detection_scale
+        if self._small is not None:
+            # Run the cascade on a downscaled copy; boxes are mapped back below
+            small_h, small_w = self._small.shape[:2]
+            cv2.resize(frame, (small_w, small_h), dst=self._small, interpolation=cv2.INTER_AREA)
+            frame = self._small
+
+        cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self._gray)
+
+        box = None
+        if self._last_box is not None and self._frames_since_full + 1 < self._config.detect_stride:
+            box = self._detect_near_last()
+            self._frames_since_full += 1
+        if box is None:
+            box = self._detect_largest(self._gray)
+            self._frames_since_full = 0
+        self._last_box = box
+
+        if box is None:
             return None
 
-        # Select the largest face by area
-        areas = [w * h for (_, _, w, h) in faces]
-        idx = int(np.argmax(areas))
-        x, y, w, h = faces[idx]
+        x, y, w, h = box
+        if scale != 1.0:
+            x, y, w, h = (int(v / scale) for v in (x, y, w, h))
 
         return FaceInfo(
             center_x=x + w // 2,
@@ -98,17 +158,52 @@ class FaceDetector:
             bbox=(int(x), int(y), int(w), int(h)),
         )
 
+    def _detect_largest(self, gray: np.ndarray) -> Optional[Tuple[int, int, int, int]]:
+        """Run the cascade on a grayscale image and return the largest face box."""
+        faces = self._cascade.detectMultiScale(
+            gray,
+            scaleFactor=self._config.scale_factor,
+            minNeighbors=self._config.min_neighbors,
+        )
+        if len(faces) == 0:
+            return None
+
+        # Select the largest face by area
+        x, y, w, h = max(faces, key=lambda f: f[2] * f[3])
+        return int(x), int(y), int(w), int(h)
+
+    def _detect_near_last(self) -> Optional[Tuple[int, int, int, int]]:
+        """Search only a padded region around the last face box."""
+        x, y, w, h = self._last_box
+        pad_x = int(w * self._config.roi_margin)
+        pad_y = int(h * self._config.roi_margin)
+        img_h, img_w = self._gray.shape
+        x0, y0 = max(0, x - pad_x), max(0, y - pad_y)
+        x1, y1 = min(img_w, x + w + pad_x), min(img_h, y + h + pad_y)
+
+        box = self._detect_largest(self._gray[y0:y1, x0:x1])
+        if box is None:
+            return None
+        bx, by, bw, bh = box
+        return bx + x0, by + y0, bw, bh
+
     @staticmethod
-    def draw_annotations(frame: np.ndarray, face: FaceInfo) -> None:
+    def draw_annotations(frame: np.ndarray, face: FaceInfo, scale: float = 1.0) -> None:
         """Draw bounding box and center marker on the frame.
 
         Args:
             frame: BGR image to annotate (modified in place).
-            face: Detected face information.
+            face: Detected face information, in full-frame pixels.
+            scale: Size of ``frame`` relative to the full frame (e.g. 0.5 when
+                drawing on ``FaceDetector.scaled_frame``).
         """
         x, y, w, h = face.bbox
+        center = (face.center_x, face.center_y)
+        if scale != 1.0:
+            x, y, w, h = (int(v * scale) for v in (x, y, w, h))
+            center = (int(center[0] * scale), int(center[1] * scale))
         cv2.rectangle(frame, (x, y), (x + w, y + h), (0, 0, 255), 2)
-        cv2.circle(frame, (face.center_x, face.center_y), 5, (0, 255, 0), cv2.FILLED)
+        cv2.circle(frame, center, 5, (0, 255, 0), cv2.FILLED)
         cv2.putText(
             frame,
             f"area={face.area}",
@@ -4,8 +4,7 @@ from __future__ import annotations
 
 import logging
 import time
-from collections import deque
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 import numpy as np
 import serial
@@ -15,6 +14,13 @@ from followme.config import GestureConfig
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on a buffered incomplete serial line (a sensor line is ~20 bytes)
+_MAX_PARTIAL_LINE = 256
+
+# Readings are stored as int32; anything outside is a corrupted line
+_READING_MIN = int(np.iinfo(np.int32).min)
+_READING_MAX = int(np.iinfo(np.int32).max)
+
 
 class SnapDetector:
     """State machine for detecting snap gestures from dual IMU sensor readings.
@@ -46,11 +52,16 @@ class SnapDetector:
             expires after last snap), or None if no complete gesture yet.
         """
         diff = sensor2 - sensor1
-        now = time.time()
 
         # Detect snap edge
         is_snap = self._detect_edge(diff)
 
+        # Common case: idle with no sequence in progress, no need to read the clock
+        if not is_snap and self._snap_count == 0:
+            return None
+
+        now = time.monotonic()
+
         if is_snap:
             if self._snap_count == 0:
                 # First snap in a new sequence
@@ -64,16 +75,101 @@ class SnapDetector:
             return None
 
         # Check if a sequence has completed (no snap within time window)
-        if self._snap_count > 0 and self._prev_snap_time is not None:
+        if self._prev_snap_time is not None:
             if now - self._prev_snap_time > self._time_window:
-                count = self._snap_count
-                self._snap_count = 0
-                self._prev_snap_time = None
-                logger.info("Snap sequence complete: %d snaps", count)
-                return count
+                return self._finish_sequence()
 
         return None
 
+    def process_burst(self, sensor1: np.ndarray, sensor2: np.ndarray) -> Optional[int]:
+        """Process a burst of readings that arrived together, vectorised.
+
+        Edges are found with the same vectorised hysteresis as
+        ``process_batch``; the whole burst shares one arrival time, so
+        grouping into sequences is done once per call rather than per sample.
+        Call with empty arrays to let a pending sequence expire while no data
+        is arriving.
+
+        Args:
+            sensor1: First IMU sensor values, oldest first.
+            sensor2: Second IMU sensor values, same length as ``sensor1``.
+
+        Returns:
+            Total snap count if a gesture sequence completed, otherwise None.
+        """
+        edges = self._edge_indices(sensor1, sensor2)
+        if edges.size == 0 and self._snap_count == 0:
+            return None
+
+        now = time.monotonic()
+        completed = None
+        if self._prev_snap_time is not None and now - self._prev_snap_time > self._time_window:
+            completed = self._finish_sequence()
+        if edges.size:
+            self._snap_count += int(edges.size)
+            self._prev_snap_time = now
+            logger.debug("Snap detected! Count: %d", self._snap_count)
+        return completed
+
+    def process_batch(
+        self,
+        sensor1: np.ndarray,
+        sensor2: np.ndarray,
+        timestamps: Optional[np.ndarray] = None,
+    ) -> List[Tuple[int, float]]:
+        """Detect snap edges across a batch of sensor readings at once.
+
+        Applies the same hysteresis as ``process_reading`` (an edge fires when
+        the difference rises above the threshold after last being below it),
+        carrying the state across batch boundaries. Sequence grouping is left
+        to the caller; use ``process_reading`` for low-latency per-sample mode.
+
+        Args:
+            sensor1: First IMU sensor values.
+            sensor2: Second IMU sensor values, same length as ``sensor1``.
+            timestamps: Optional per-sample times. If None, every edge is
+                stamped with ``time.monotonic()`` at the time of this call.
+
+        Returns:
+            List of (sample index, timestamp) for each detected snap edge.
+        """
+        edges = self._edge_indices(sensor1, sensor2)
+        if timestamps is None:
+            now = time.monotonic()
+            return [(int(i), now) for i in edges]
+        return [(int(i), float(timestamps[i])) for i in edges]
+
+    def _edge_indices(self, sensor1: np.ndarray, sensor2: np.ndarray) -> np.ndarray:
+        """Return indices of snap edges in a batch, updating the hysteresis flag."""
+        diff = np.asarray(sensor2, dtype=np.int64) - np.asarray(sensor1, dtype=np.int64)
+        if diff.size == 0:
+            return np.empty(0, dtype=np.intp)
+
+        above = diff > self._threshold
+        below = diff < self._threshold
+
+        # Index of the most recent sample that set the hysteresis flag; samples
+        # exactly at the threshold leave it unchanged, as in _detect_edge.
+        decided = np.where(above | below, np.arange(diff.size), -1)
+        last_decided = np.maximum.accumulate(decided)
+        prev_decided = np.concatenate(([-1], last_decided[:-1]))
+        valid_before = np.where(
+            prev_decided >= 0, below[np.maximum(prev_decided, 0)], self._valid
+        )
+        edges = np.flatnonzero(above & valid_before)
+
+        if last_decided[-1] >= 0:
+            self._valid = bool(below[last_decided[-1]])
+        return edges
+
+    def _finish_sequence(self) -> int:
+        """Close the current snap sequence and return its snap count."""
+        count = self._snap_count
+        self._snap_count = 0
+        self._prev_snap_time = None
+        logger.info("Snap sequence complete: %d snaps", count)
+        return count
+
     def _detect_edge(self, diff: int) -> bool:
         """Detect a snap using hysteresis to prevent false positives."""
         if diff > self._threshold and self._valid:
@@ -96,6 +192,10 @@ class SerialIMUReader:
     Expects comma-separated integer pairs (sensor1, sensor2) per line
     from a Teensy 4.1 with two MPU6050 sensors.
 
+    Reads block in the kernel (pyserial waits in select()) for at most
+    ``read_timeout`` seconds, so the caller's loop sleeps while the link is
+    idle instead of polling, yet still regains control if data stops.
+
     Args:
         config: Gesture configuration with serial port and baud rate.
     """
@@ -103,42 +203,125 @@ class SerialIMUReader:
     def __init__(self, config: GestureConfig) -> None:
         self._port = config.serial_port
         self._baud = config.baud_rate
+        self._timeout = config.read_timeout
         self._max_buffer = config.max_sensor_buffer
         self._ser: Optional[serial.Serial] = None
-        self._sensor1_history: deque = deque(maxlen=config.max_sensor_buffer)
-        self._sensor2_history: deque = deque(maxlen=config.max_sensor_buffer)
+        self._partial = b""  # Start of a line cut off by a read timeout
+
+        # Preallocated ring buffers (one array per sensor) for recent readings
+        self._sensor1_history = np.zeros(self._max_buffer, dtype=np.int32)
+        self._sensor2_history = np.zeros_like(self._sensor1_history)
+        self._head = 0
+        self._count = 0
 
     def connect(self) -> None:
         """Open the serial connection and list available ports for debugging."""
         self._list_available_ports()
-        self._ser = serial.Serial(self._port, self._baud)
+        self._ser = serial.Serial(self._port, self._baud, timeout=self._timeout)
         logger.info("Serial port opened: %s @ %d baud", self._port, self._baud)
 
     def read_sensors(self) -> Optional[Tuple[int, int]]:
         """Read one line of sensor data from serial.
 
         Returns:
-            Tuple of (sensor1, sensor2) integer values, or None on error.
+            Tuple of (sensor1, sensor2) integer values, or None on error or
+            if no complete line arrived within the read timeout.
         """
         if self._ser is None or not self._ser.is_open:
             return None
 
+        line = self._ser.readline()
+        if not line.endswith(b"\n"):
+            # Timed out mid-line; keep the fragment for the next read
+            self._partial = (self._partial + line)[-_MAX_PARTIAL_LINE:]
+            return None
+        if self._partial:
+            line = self._partial + line
+            self._partial = b""
+
+        reading = self._parse_line(line)
+        if reading is not None:
+            self._store(*reading)
+        return reading
+
+    def read_available(self) -> int:
+        """Read every complete line that has arrived into the history buffer.
+
+        Blocks for up to the read timeout until the first line arrives, then
+        takes whatever else is already buffered without waiting. Use with
+        ``recent(n)`` and ``SnapDetector.process_burst`` to handle bursts
+        in one vectorised pass.
+
+        Returns:
+            Number of readings added to the history buffer.
+        """
+        if self._ser is None or not self._ser.is_open:
+            return 0
+
+        data = self._ser.readline()
+        waiting = self._ser.in_waiting
+        if waiting:
+            data += self._ser.read(waiting)
+
+        lines = (self._partial + data).split(b"\n")
+        self._partial = lines.pop()[-_MAX_PARTIAL_LINE:]
+
+        added = 0
+        for line in lines:
+            reading = self._parse_line(line)
+            if reading is not None:
+                self._store(*reading)
+                added += 1
+        return added
+
+    @staticmethod
+    def _parse_line(line: bytes) -> Optional[Tuple[int, int]]:
+        """Parse the first two ASCII integers of a sensor line."""
+        # Work on the raw bytes; int() accepts bytes and ignores whitespace/CRLF.
+        sep = line.find(b",")
+        if sep < 0:
+            return None
+        end = line.find(b",", sep + 1)
         try:
-            line = self._ser.readline().decode("utf-8").strip()
-            if not line:
-                return None
-            values = [int(x) for x in line.split(", ")]
-            if len(values) < 2:
-                return None
-
-            s1, s2 = values[0], values[1]
-            self._sensor1_history.append(s1)
-            self._sensor2_history.append(s2)
-            return (s1, s2)
-
-        except (ValueError, UnicodeDecodeError) as e:
+            s1 = int(line[:sep])
+            s2 = int(line[sep + 1:end] if end >= 0 else line[sep + 1:])
+        except ValueError as e:
             logger.debug("Failed to parse serial data: %s", e)
             return None
+        if not (_READING_MIN <= s1 <= _READING_MAX and _READING_MIN <= s2 <= _READING_MAX):
+            logger.debug("Serial reading out of range: %r", line)
+            return None
+        return (s1, s2)
+
+    def _store(self, s1: int, s2: int) -> None:
+        """Append one reading to the ring buffers."""
+        head = self._head
+        self._sensor1_history[head] = s1
+        self._sensor2_history[head] = s2
+        self._head = (head + 1) % self._max_buffer
+        if self._count < self._max_buffer:
+            self._count += 1
+
+    def recent(self, n: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the most recent sensor readings in arrival order.
+
+        Args:
+            n: Number of readings to return; defaults to all buffered readings.
+
+        Returns:
+            Tuple of (sensor1, sensor2) int32 arrays. These are views into the
+            ring buffer unless the requested span wraps around its end.
+        """
+        count = self._count if n is None else max(0, min(n, self._count))
+        start = (self._head - count) % self._max_buffer
+        stop = start + count
+        if stop <= self._max_buffer:
+            return self._sensor1_history[start:stop], self._sensor2_history[start:stop]
+        wrap = stop - self._max_buffer
+        return (
+            np.concatenate((self._sensor1_history[start:], self._sensor1_history[:wrap])),
+            np.concatenate((self._sensor2_history[start:], self._sensor2_history[:wrap])),
+        )
 
     def close(self) -> None:
         """Close the serial connection."""
@@ -1,25 +1,39 @@
-"""Inter-process command channel using atomic file operations."""
+"""Inter-process command channel using a memory-mapped command ring."""
 
 from __future__ import annotations
 
 import logging
+import mmap
 import os
-import pickle
+import struct
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 from followme.commands import Command
 from followme.config import IPCConfig
 
 logger = logging.getLogger(__name__)
 
+# File layout: header of (generation, write_index) as little-endian uint32,
+# followed by a ring of uint8 snap counts.
+_HEADER = struct.Struct("<II")
+_FILE_SIZE = 4096
+_RING_OFFSET = _HEADER.size
+_RING_CAPACITY = _FILE_SIZE - _RING_OFFSET
+_MAX_SNAP_COUNT = 0xFF
+
 
 class CommandChannel:
     """File-based IPC for passing gesture commands to the drone controller.
 
-    The gesture recognition process writes snap counts to a pickle cache file.
-    The drone controller reads new commands since its last read.
-    Writes are atomic (temp file + os.replace) to prevent corruption.
+    Both processes memory-map the same small fixed-size file, so commands
+    travel through the shared page cache without serialization. The gesture
+    recognition process stores each snap count in a ring of uint8 slots and
+    then bumps ``write_index`` in the header. The drone controller compares
+    ``write_index`` with its own read cursor and reads only the new slots.
+
+    ``initialize`` bumps the header ``generation`` in place; a reader that sees
+    a new generation rewinds its cursor, so restarting the writer is safe.
 
     Args:
         config: IPC configuration with cache file path.
@@ -27,20 +41,50 @@ class CommandChannel:
 
     def __init__(self, config: IPCConfig) -> None:
         self._cache_path = Path(config.cache_file)
+        self._mm: Optional[mmap.mmap] = None
+        self._written: int = 0
+        self._write_index: int = 0
+        self._generation: Optional[int] = None
         self._read_index: int = 0
 
     def initialize(self) -> None:
-        """Create an empty command cache file. Called once by the writer at startup."""
-        self._write_atomic([])
-        logger.info("Initialized command cache at %s", self._cache_path)
+        """Create or reset the command file. Called once by the writer at startup."""
+        fd = os.open(self._cache_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if os.fstat(fd).st_size != _FILE_SIZE:
+                os.ftruncate(fd, _FILE_SIZE)
+            self._mm = mmap.mmap(fd, _FILE_SIZE, access=mmap.ACCESS_WRITE)
+        finally:
+            os.close(fd)
+
+        previous_generation, _ = _HEADER.unpack_from(self._mm, 0)
+        self._generation = (previous_generation + 1) & 0xFFFFFFFF
+        self._written = 0
+        self._write_index = 0
+        _HEADER.pack_into(self._mm, 0, self._generation, 0)
+        logger.info("Initialized command ring at %s", self._cache_path)
 
     def write_commands(self, commands: List[int]) -> None:
-        """Atomically write the full command list to the cache file.
+        """Publish commands not yet written to the ring.
+
+        Args:
+            commands: Complete list of snap counts accumulated so far. Only the
+                entries beyond those already written are stored.
+        """
+        new = commands[self._written:]
+        if not new:
+            return
+        self._publish(new)
+        self._written = len(commands)
+
+    def append_command(self, snap_count: int) -> None:
+        """Publish a single snap count, independent of any accumulated history.
 
         Args:
-            commands: Complete list of snap counts accumulated so far.
+            snap_count: Number of snaps in the completed gesture.
         """
-        self._write_atomic(commands)
+        self._publish((snap_count,))
+        self._written += 1
 
     def read_new_commands(self) -> List[Optional[Command]]:
         """Read commands added since the last read.
@@ -48,19 +92,35 @@ class CommandChannel:
         Returns:
             List of new Command values (or None for unrecognized snap counts).
         """
-        try:
-            with open(self._cache_path, "rb") as f:
-                all_snaps: List[int] = pickle.load(f)
-        except FileNotFoundError:
+        if self._mm is None and not self._open_reader():
             return []
-        except (pickle.UnpicklingError, EOFError) as e:
-            logger.warning("Failed to read command cache: %s", e)
+
+        mm = self._mm
+        generation, write_index = _HEADER.unpack_from(mm, 0)
+        if generation != self._generation or write_index < self._read_index:
+            # Writer (re)initialized the ring; start from the beginning
+            self._generation = generation
+            self._read_index = 0
+        if write_index == self._read_index:
             return []
 
+        if write_index - self._read_index > _RING_CAPACITY:
+            dropped = write_index - self._read_index - _RING_CAPACITY
+            logger.warning("Command ring overrun, dropped %d commands", dropped)
+            self._read_index = write_index - _RING_CAPACITY
+
+        # Copy the new span out of the ring in at most two slices
+        start = _RING_OFFSET + self._read_index % _RING_CAPACITY
+        stop = start + (write_index - self._read_index)
+        ring_end = _RING_OFFSET + _RING_CAPACITY
+        if stop <= ring_end:
+            snap_counts = mm[start:stop]
+        else:
+            snap_counts = mm[start:ring_end] + mm[_RING_OFFSET:stop - _RING_CAPACITY]
+        self._read_index = write_index
+
         new_commands = []
-        while self._read_index < len(all_snaps):
-            snap_count = all_snaps[self._read_index]
-            self._read_index += 1
+        for snap_count in snap_counts:
             cmd = Command.from_snap_count(snap_count)
             if cmd is not None:
                 new_commands.append(cmd)
@@ -68,9 +128,37 @@ class CommandChannel:
 
         return new_commands
 
-    def _write_atomic(self, data: List[int]) -> None:
-        """Write data to a temp file then atomically replace the cache file."""
-        tmp_path = self._cache_path.with_suffix(".pkl.tmp")
-        with open(tmp_path, "wb") as f:
-            pickle.dump(data, f)
-        os.replace(tmp_path, self._cache_path)
+    def _publish(self, snap_counts: Sequence[int]) -> None:
+        """Store snap counts in the ring, then advance the header write index."""
+        if self._mm is None:
+            raise RuntimeError("CommandChannel.initialize() must be called before writing")
+
+        mm = self._mm
+        data = bytes(min(c, _MAX_SNAP_COUNT) for c in snap_counts)[-_RING_CAPACITY:]
+        index = self._write_index + len(snap_counts)
+        start = _RING_OFFSET + (index - len(data)) % _RING_CAPACITY
+        first = min(len(data), _RING_OFFSET + _RING_CAPACITY - start)
+        mm[start:start + first] = data[:first]
+        if first < len(data):
+            mm[_RING_OFFSET:_RING_OFFSET + len(data) - first] = data[first:]
+        # Publish the entries only after they are in place
+        _HEADER.pack_into(mm, 0, self._generation, index)
+        self._write_index = index
+
+    def close(self) -> None:
+        """Unmap the command file."""
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+
+    def _open_reader(self) -> bool:
+        """Map the command file read-only once the writer has created it."""
+        try:
+            with open(self._cache_path, "rb") as f:
+                if os.fstat(f.fileno()).st_size < _FILE_SIZE:
+                    return False
+                self._mm = mmap.mmap(f.fileno(), _FILE_SIZE, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            return False
+        logger.info("Mapped command ring at %s", self._cache_path)
+        return True
@@ -9,7 +9,7 @@ from typing import Optional, Tuple
 from followme.config import PIDConfig
 
 
-@dataclass
+@dataclass(slots=True)
 class PIDController:
     """Proportional-Integral-Derivative controller.
 
@@ -33,6 +33,16 @@ class PIDController:
     _prev_error: Optional[float] = field(default=None, init=False, repr=False)
     _last_time: Optional[float] = field(default=None, init=False, repr=False)
 
+    # Gains copied from the frozen config once, to skip attribute chains per update
+    _kp: float = field(default=0.0, init=False, repr=False)
+    _ki: float = field(default=0.0, init=False, repr=False)
+    _kd: float = field(default=0.0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._kp = self.config.kp
+        self._ki = self.config.ki
+        self._kd = self.config.kd
+
     def update(self, error: float, dt: Optional[float] = None) -> float:
         """Compute the PID output for the given error.
 
@@ -50,7 +60,7 @@ class PIDController:
         self._last_time = now
 
         # Proportional
-        p_term = self.config.kp * error
+        p_term = self._kp * error
 
         # Integral with anti-windup
         self._integral += error * dt
@@ -59,11 +69,11 @@ class PIDController:
                 -self.integral_limit,
                 min(self.integral_limit, self._integral),
             )
-        i_term = self.config.ki * self._integral
+        i_term = self._ki * self._integral
 
         # Derivative
         if self._prev_error is not None and dt > 0:
-            d_term = self.config.kd * (error - self._prev_error) / dt
+            d_term = self._kd * (error - self._prev_error) / dt
         else:
             d_term = 0.0
         self._prev_error = error
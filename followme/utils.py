@@ -4,8 +4,8 @@ from __future__ import annotations
 
 import logging
 import signal
-import sys
-from typing import Callable
+import threading
+from typing import Optional
 
 
 def setup_logging(debug: bool = False) -> None:
@@ -15,6 +15,10 @@ def setup_logging(debug: bool = False) -> None:
         debug: If True, set level to DEBUG; otherwise INFO.
     """
     level = logging.DEBUG if debug else logging.INFO
+    # The format uses none of these, so skip collecting them for every record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
     logging.basicConfig(
         level=level,
         format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
@@ -22,22 +26,43 @@ def setup_logging(debug: bool = False) -> None:
     )
 
 
+_SIGNAL_NAMES = {signal.SIGINT: "SIGINT", signal.SIGTERM: "SIGTERM"}
+
+
 def register_shutdown_handler(
-    cleanup_fn: Callable[[], None],
     logger: logging.Logger,
-) -> None:
-    """Register SIGINT/SIGTERM handlers that call cleanup before exiting.
+    teardown: Optional[threading.Event] = None,
+) -> threading.Event:
+    """Register SIGINT/SIGTERM handlers that request a graceful shutdown.
+
+    The first signal only sets the returned event; the caller's main loop
+    checks it and runs cleanup itself. A repeated signal restores the default
+    handlers and raises ``KeyboardInterrupt`` so a hung call can still be
+    broken out of, unless ``teardown`` is set: once cleanup has started a
+    repeat is only logged, so landing cannot be interrupted halfway.
 
     Args:
-        cleanup_fn: Function to call on shutdown (e.g., drone.cleanup).
         logger: Logger for shutdown messages.
+        teardown: Optional event the caller sets when it begins cleanup.
+
+    Returns:
+        Event that is set once a shutdown signal has been received.
     """
+    shutdown = threading.Event()
 
     def _handler(signum: int, _frame) -> None:
-        sig_name = signal.Signals(signum).name
+        sig_name = _SIGNAL_NAMES.get(signum, str(signum))
+        if shutdown.is_set():
+            if teardown is not None and teardown.is_set():
+                logger.info("Received %s, shutdown already in progress", sig_name)
+                return
+            logger.warning("Received %s again, forcing exit", sig_name)
+            signal.signal(signal.SIGINT, signal.default_int_handler)
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            raise KeyboardInterrupt
         logger.info("Received %s, shutting down...", sig_name)
-        cleanup_fn()
-        sys.exit(0)
+        shutdown.set()
 
     signal.signal(signal.SIGINT, _handler)
     signal.signal(signal.SIGTERM, _handler)
+    return shutdown
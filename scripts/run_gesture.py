@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import argparse
 import logging
+from collections import deque
 
 from followme.config import load_config
 from followme.gesture import SerialIMUReader, SnapDetector
@@ -40,25 +41,26 @@ def main() -> None:
     commands = CommandChannel(config.ipc)
     commands.initialize()
 
-    all_snaps: list[int] = []
+    # Recent gestures only; the command channel keeps its own bounded ring
+    recent_snaps: deque[int] = deque(maxlen=config.ipc.history_size)
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
     try:
         reader.connect()
         logger.info("Gesture recognition running. Press Ctrl+C to stop.")
 
         while True:
-            reading = reader.read_sensors()
-            if reading is None:
-                continue
-
-            s1, s2 = reading
-            snap_count = detector.process_reading(s1, s2)
+            # Handle everything that arrived since the last wakeup in one pass;
+            # an empty burst still lets a pending sequence time out.
+            count = reader.read_available()
+            snap_count = detector.process_burst(*reader.recent(count))
 
             if snap_count is not None:
                 logger.info("Gesture detected: %d snaps", snap_count)
-                all_snaps.append(snap_count)
-                commands.write_commands(all_snaps)
-                logger.debug("Command cache updated: %s", all_snaps)
+                recent_snaps.append(snap_count)
+                commands.append_command(snap_count)
+                if debug_enabled:
+                    logger.debug("Recent snaps: %s", list(recent_snaps))
 
     except KeyboardInterrupt:
         logger.info("Interrupted by user")
@@ -66,6 +68,7 @@ def main() -> None:
         logger.error("Unexpected error: %s", e, exc_info=True)
     finally:
         reader.close()
+        commands.close()
         logger.info("Gesture recognition stopped")
 
 
@@ -5,19 +5,23 @@ from __future__ import annotations
 
 import argparse
 import logging
+import os
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional, Tuple
 
-import cv2
-
+# cv2, djitellopy and the modules built on them are imported in main(), after
+# argument parsing, so `--help` and bad arguments don't pay for loading them.
 from followme.commands import Command
 from followme.config import load_config
-from followme.drone_controller import CircleRecorder, DroneConnection, FaceTracker, take_picture
-from followme.face_detector import FaceDetector
 from followme.ipc import CommandChannel
 from followme.utils import register_shutdown_handler, setup_logging
 
 logger = logging.getLogger(__name__)
 
+_KEY_QUIT = ord("q")
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Follow-Me Drone: Face Tracking Controller")
@@ -32,68 +36,165 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def configure_cpu(
+    set_num_threads: Callable[[int], None],
+    cv_threads: int,
+    cpu_affinity: Optional[Tuple[int, ...]],
+) -> None:
+    """Limit OpenCV's worker pool and optionally pin the process to CPUs.
+
+    Args:
+        set_num_threads: ``cv2.setNumThreads``, passed in so OpenCV is only
+            imported by ``main()``.
+        cv_threads: OpenCV worker threads; 0 leaves half the cores free for
+            the control loop and the drone's video decoder.
+        cpu_affinity: CPU indices to pin this process to, or None to leave
+            scheduling to the OS.
+    """
+    if cv_threads <= 0:
+        cv_threads = max(1, (os.cpu_count() or 2) // 2)
+    set_num_threads(cv_threads)
+    logger.info("OpenCV threads: %d", cv_threads)
+
+    if not cpu_affinity:
+        return
+    if not hasattr(os, "sched_setaffinity"):
+        logger.warning("CPU affinity is not supported on this platform, ignoring")
+        return
+    try:
+        os.sched_setaffinity(0, set(cpu_affinity))
+        logger.info("Pinned to CPUs %s", sorted(cpu_affinity))
+    except OSError as e:
+        logger.warning("Could not set CPU affinity %s: %s", cpu_affinity, e)
+
+
+def _log_photo_error(future: Future) -> None:
+    """Log an exception raised by a background ``take_picture`` call."""
+    error = future.exception()
+    if error is not None:
+        logger.error("Failed to save picture: %s", error, exc_info=error)
+
+
 def main() -> None:
     args = parse_args()
     setup_logging(debug=args.debug)
 
+    import cv2
+    import numpy as np
+
+    from followme.drone_controller import (
+        CircleRecorder,
+        DroneConnection,
+        FaceTracker,
+        take_picture,
+    )
+    from followme.face_detector import FaceDetector
+
     config = load_config(args.config)
     logger.info("Configuration loaded")
 
+    configure_cpu(cv2.setNumThreads, config.tracking.cv_threads, config.tracking.cpu_affinity)
+
     # Initialize components
     drone = DroneConnection(config.drone)
-    detector = FaceDetector(config.face_detection)
-    tracker = FaceTracker(config.tracking, config.drone)
+    detector = FaceDetector(
+        config.face_detection,
+        frame_size=(config.drone.frame_width, config.drone.frame_height),
+    )
+    tracker = FaceTracker(
+        config.tracking, config.drone,
+        center_history_size=config.face_detection.center_history_size,
+    )
     commands = CommandChannel(config.ipc)
     circle = CircleRecorder(config.circle_motion)
+    # Image encoding and disk writes happen off the control loop
+    photo_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="photo")
 
-    # Register graceful shutdown
-    register_shutdown_handler(drone.cleanup, logger)
+    # Register graceful shutdown; cleanup runs in the finally block below
+    teardown = threading.Event()
+    shutdown = register_shutdown_handler(logger, teardown)
 
     try:
         drone.connect()
+        if shutdown.is_set():
+            logger.info("Shutdown requested before takeoff")
+            return
         drone.takeoff()
 
         logger.info("Entering main control loop")
-        while True:
-            frame = drone.get_frame()
-            face = detector.detect(frame)
-
-            if face is not None:
-                FaceDetector.draw_annotations(frame, face)
-
-            # Compute and send tracking control
-            lr, fb, ud, yaw = tracker.compute_control(face, drone)
-
-            # Height safety enforcement
-            if drone.get_height() > config.drone.height_limit:
-                logger.warning("Height limit reached, descending")
-                drone.send_control(0, 0, -10, 0)
-            else:
-                drone.send_control(lr, fb, ud, yaw)
+        next_tick = time.monotonic()
+        loop_interval = config.tracking.loop_interval
+        display_every = max(1, config.tracking.display_every)
+        view_scale = config.face_detection.detection_scale
+        iteration = 0
+        # Only used when displaying at full resolution (detection_scale 1.0)
+        display_buf: Optional[np.ndarray] = None
+
+        # Bind per-iteration callables to locals once, outside the hot loop
+        get_frame = drone.get_frame
+        drone_tick = drone.tick
+        detect = detector.detect
+        draw_annotations = FaceDetector.draw_annotations
+        compute_control = tracker.compute_control
+        read_new_commands = commands.read_new_commands
+        imshow = cv2.imshow
+        wait_key = cv2.waitKey
+        monotonic = time.monotonic
+
+        while not shutdown.is_set():
+            frame = get_frame()
+            face = detect(frame)
+
+            # Compute and send tracking control (descends instead above the height limit)
+            drone_tick(*compute_control(face))
 
             # Process gesture commands
-            new_commands = commands.read_new_commands()
+            new_commands = read_new_commands()
             for cmd in new_commands:
                 if cmd == Command.CIRCLE_MOTION:
                     logger.info("Executing circle motion command")
                     tracker.reset()
-                    circle.execute(drone)
+                    circle.execute(drone, stop=shutdown)
                 elif cmd == Command.TAKE_PHOTO:
                     logger.info("Executing take photo command")
-                    take_picture(frame)
-
-            # Display video feed
-            cv2.imshow("Output", frame)
-            if cv2.waitKey(1) & 0xFF == ord("q"):
-                logger.info("Quit key pressed")
-                break
-
-            time.sleep(config.tracking.loop_interval)
+                    # The drone's frame reader replaces (never mutates) its frame array
+                    photo = photo_pool.submit(take_picture, frame)
+                    photo.add_done_callback(_log_photo_error)
+
+            # Display video feed (every Nth iteration to keep GUI work off most loops).
+            # Reuse the detector's downscaled copy so full-res pixels are not
+            # annotated or pushed to the display.
+            iteration += 1
+            if iteration % display_every == 0:
+                view = detector.scaled_frame
+                if view is None:
+                    # Annotate a copy: the drone's frame is shared with its reader
+                    if display_buf is None or display_buf.shape != frame.shape:
+                        display_buf = np.empty_like(frame)
+                    np.copyto(display_buf, frame)
+                    view = display_buf
+                if face is not None:
+                    draw_annotations(view, face, view_scale)
+                imshow("Output", view)
+                if wait_key(1) & 0xFF == _KEY_QUIT:
+                    logger.info("Quit key pressed")
+                    break
+
+            # Sleep only for what is left of this iteration's time slot
+            next_tick += loop_interval
+            slack = next_tick - monotonic()
+            if slack > 0:
+                time.sleep(slack)
+            else:
+                next_tick = monotonic()
 
     except Exception as e:
         logger.error("Unexpected error: %s", e, exc_info=True)
     finally:
+        teardown.set()
         drone.cleanup()
+        photo_pool.shutdown(wait=True)
+        commands.close()
         cv2.destroyAllWindows()
         logger.info("Shutdown complete")
 